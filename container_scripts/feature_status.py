@@ -14,6 +14,12 @@ import json
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional - stdlib json also accepts bytes
+    _json_loads = json.loads
+
 BEADS_DIR = Path("/project/.beads")
 ISSUES_FILE = BEADS_DIR / "issues.jsonl"
 
@@ -61,17 +67,9 @@ def read_issues() -> list[dict]:
     if not ISSUES_FILE.exists():
         return []
 
-    issues = []
     try:
-        with open(ISSUES_FILE, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    issues.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
+        # Read the whole file once and split in C instead of iterating a text stream
+        data = ISSUES_FILE.read_bytes()
     except (PermissionError, OSError) as e:
         print(json.dumps({
             "success": False,
@@ -81,6 +79,16 @@ def read_issues() -> list[dict]:
         }))
         sys.exit(1)
 
+    issues = []
+    for line in data.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            issues.append(_json_loads(line))
+        except ValueError:  # JSONDecodeError (stdlib or orjson) or bad UTF-8
+            continue
+
     return issues
 
 
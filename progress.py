@@ -9,12 +9,99 @@ Uses cached feature data from container polling.
 import json
 import os
 import urllib.request
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional - stdlib json also accepts bytes
+    _json_loads = json.loads
+
 WEBHOOK_URL = os.environ.get("PROGRESS_N8N_WEBHOOK_URL")
 PROGRESS_CACHE_FILE = ".progress_cache"
 
+# Summaries of issues.jsonl keyed by path, valid while (mtime_ns, size) is unchanged
+_scan_cache: dict[str, tuple[tuple[int, int], dict]] = {}
+
+# Summary for an empty issues.jsonl (returned without opening the file)
+_EMPTY_SCAN = {"has_issues": False, "has_open": False, "passing": 0, "in_progress": 0, "total": 0}
+
+
+def _line_status(line: bytes) -> str | None:
+    """
+    Get the status of a single JSONL issue record.
+
+    Returns:
+        The status string ("" if the record's status isn't a string, such as
+        null), or None if the line isn't a valid JSON object
+    """
+    try:
+        issue = _json_loads(line)
+    except ValueError:  # JSONDecodeError (stdlib or orjson) or bad UTF-8
+        return None
+    if not isinstance(issue, dict):
+        return None  # Valid JSON but not a record, e.g. [1]
+    status = issue.get("status", "open")
+    return status if isinstance(status, str) else ""  # Still a record, just in no bucket
+
+
+def _issues_path(project_dir: Path) -> str:
+    """Get the path to a project's .beads/issues.jsonl as a plain string."""
+    return os.path.join(project_dir, ".beads", "issues.jsonl")
+
+
+def _read_issues(issues_path: str) -> bytes:
+    """Read the whole issues file in one call (raises OSError if missing or unreadable)."""
+    with open(issues_path, "rb") as f:
+        return f.read()
+
+
+def _scan_issues(issues_path: str) -> dict | None:
+    """
+    Summarize an issues.jsonl file in a single pass.
+
+    The summary is cached until the file's mtime or size changes, so
+    has_features, has_open_features and count_passing_tests share one
+    read of the file.
+
+    Returns:
+        Dict with has_issues, has_open, passing, in_progress and total,
+        or None if the file is missing or can't be read
+    """
+    try:
+        st = os.stat(issues_path)
+        if st.st_size == 0:
+            return _EMPTY_SCAN
+        version = (st.st_mtime_ns, st.st_size)
+        cached = _scan_cache.get(issues_path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        data = _read_issues(issues_path)
+    except (PermissionError, OSError):
+        return None
+
+    has_issues = False
+    counts = Counter()
+    for line in data.splitlines():
+        if line.strip():
+            has_issues = True  # Any non-blank line counts, even if malformed
+            status = _line_status(line)
+            if status is not None:
+                counts[status] += 1
+
+    summary = {
+        "has_issues": has_issues,
+        "has_open": counts["open"] > 0 or counts["in_progress"] > 0,
+        "passing": counts["closed"],
+        "in_progress": counts["in_progress"],
+        "total": counts.total(),
+    }
+
+    _scan_cache[issues_path] = (version, summary)
+    return summary
+
 
 def has_features(project_dir: Path, project_name: str | None = None) -> bool:
     """
@@ -39,15 +126,10 @@ def has_features(project_dir: Path, project_name: str | None = None) -> bool:
             pass  # Server modules not available
 
     # Direct JSONL check
-    issues_file = project_dir / ".beads" / "issues.jsonl"
-    if issues_file.exists():
-        try:
-            with open(issues_file, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        return True  # At least one issue exists
-        except (PermissionError, OSError):
-            pass  # Can't read - try database check
+    summary = _scan_issues(_issues_path(project_dir))
+    if summary is not None and summary["has_issues"]:
+        return True  # At least one issue exists
+    # Missing, unreadable or no issues - try database check
 
     # Check SQLite database for issues
     db_file = project_dir / ".beads" / "beads.db"
@@ -56,11 +138,12 @@ def has_features(project_dir: Path, project_name: str | None = None) -> bool:
             import sqlite3
             conn = sqlite3.connect(str(db_file))
             cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM issues")
-            count = cursor.fetchone()[0]
+            # EXISTS stops at the first row instead of counting the whole table
+            cursor.execute("SELECT EXISTS(SELECT 1 FROM issues)")
+            exists = bool(cursor.fetchone()[0])
             conn.close()
-            print(f"[DEBUG] has_features DB check: project={project_name}, count={count}")
-            return count > 0
+            print(f"[DEBUG] has_features DB check: project={project_name}, exists={exists}")
+            return exists
         except Exception as e:
             print(f"[DEBUG] has_features DB error: {e}")
             pass  # Database error - assume no issues
@@ -93,21 +176,9 @@ def has_open_features(project_dir: Path, project_name: str | None = None) -> boo
             pass  # Server modules not available
 
     # Fallback: Direct JSONL check
-    issues_file = project_dir / ".beads" / "issues.jsonl"
-    if issues_file.exists():
-        try:
-            with open(issues_file, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            issue = json.loads(line)
-                            status = issue.get("status", "open")
-                            if status in ("open", "in_progress"):
-                                return True
-                        except json.JSONDecodeError:
-                            continue
-        except (PermissionError, OSError):
-            pass  # Can't read file
+    summary = _scan_issues(_issues_path(project_dir))
+    if summary is not None:  # None means the file is missing or can't be read
+        return summary["has_open"]
 
     return False
 
@@ -142,28 +213,9 @@ def count_passing_tests(project_dir: Path, project_name: str | None = None) -> t
             pass  # Server modules not available
 
     # Fallback: try to read JSONL directly (may fail with permission error)
-    issues_file = project_dir / ".beads" / "issues.jsonl"
-    if issues_file.exists():
-        try:
-            passing = 0
-            in_progress = 0
-            total = 0
-            with open(issues_file, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            issue = json.loads(line)
-                            total += 1
-                            status = issue.get("status", "open")
-                            if status == "closed":
-                                passing += 1
-                            elif status == "in_progress":
-                                in_progress += 1
-                        except json.JSONDecodeError:
-                            continue
-            return passing, in_progress, total
-        except (PermissionError, OSError):
-            pass  # Can't read file
+    summary = _scan_issues(_issues_path(project_dir))
+    if summary is not None:  # None means the file is missing or can't be read
+        return summary["passing"], summary["in_progress"], summary["total"]
 
     return 0, 0, 0
 
@@ -200,34 +252,32 @@ def get_all_passing_features(project_dir: Path, project_name: str | None = None)
             pass  # Server modules not available
 
     # Fallback: try to read JSONL directly
-    issues_file = project_dir / ".beads" / "issues.jsonl"
-    if issues_file.exists():
+    try:
+        data = _read_issues(_issues_path(project_dir))
+    except (PermissionError, OSError):
+        return []  # Missing or can't read file
+
+    passing = []
+    for line in data.splitlines():
+        if not line.strip():
+            continue
         try:
-            passing = []
-            with open(issues_file, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            issue = json.loads(line)
-                            if issue.get("status") == "closed":
-                                # Extract category from labels
-                                category = ""
-                                for label in issue.get("labels", []):
-                                    if label.startswith("category:"):
-                                        category = label[9:]
-                                        break
-                                passing.append({
-                                    "id": issue.get("id", ""),
-                                    "category": category,
-                                    "name": issue.get("title", ""),
-                                })
-                        except json.JSONDecodeError:
-                            continue
-            return passing
-        except (PermissionError, OSError):
-            pass  # Can't read file
-
-    return []
+            issue = _json_loads(line)
+        except ValueError:  # JSONDecodeError (stdlib or orjson) or bad UTF-8
+            continue
+        if isinstance(issue, dict) and issue.get("status") == "closed":
+            # Extract category from labels
+            category = ""
+            for label in issue.get("labels", []):
+                if label.startswith("category:"):
+                    category = label[9:]
+                    break
+            passing.append({
+                "id": issue.get("id", ""),
+                "category": category,
+                "name": issue.get("title", ""),
+            })
+    return passing
 
 
 def send_progress_webhook(passing: int, total: int, project_dir: Path, project_name: str | None = None) -> None:
@@ -16,6 +16,50 @@ from pathlib import Path
 # Base templates location (generic templates)
 TEMPLATES_DIR = Path(__file__).parent / ".claude" / "templates"
 
+# Prompt file contents keyed by path, valid while (mtime_ns, size) is unchanged
+_prompt_cache: dict[str, tuple[tuple[int, int], str]] = {}
+
+
+def _read_cached(path: Path) -> str:
+    """
+    Read a prompt file, reusing the cached text if the file hasn't changed.
+
+    Raises:
+        OSError: If the file is missing or can't be read
+    """
+    key = str(path)
+    st = os.stat(key)
+    version = (st.st_mtime_ns, st.st_size)
+    cached = _prompt_cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    content = path.read_text(encoding="utf-8")
+    _prompt_cache[key] = (version, content)
+    return content
+
+
+# Template file names in TEMPLATES_DIR, valid while the directory's mtime is unchanged
+_template_index: tuple[int, frozenset[str]] | None = None
+
+
+def _available_templates() -> frozenset[str]:
+    """
+    Get the names of all base template files.
+
+    Lists TEMPLATES_DIR once and reuses the result until files are added or
+    removed, instead of stat-ing each template before copying it.
+    """
+    global _template_index
+    try:
+        mtime = os.stat(TEMPLATES_DIR).st_mtime_ns
+    except OSError:
+        return frozenset()
+    if _template_index is None or _template_index[0] != mtime:
+        with os.scandir(TEMPLATES_DIR) as entries:
+            names = frozenset(entry.name for entry in entries if entry.is_file())
+        _template_index = (mtime, names)
+    return _template_index[1]
+
 
 def get_project_prompts_dir(project_dir: Path) -> Path:
     """Get the prompts directory for a specific project."""
@@ -44,19 +88,21 @@ def load_prompt(name: str, project_dir: Path | None = None) -> str:
     if project_dir:
         project_prompts = get_project_prompts_dir(project_dir)
         project_path = project_prompts / f"{name}.md"
-        if project_path.exists():
-            try:
-                return project_path.read_text(encoding="utf-8")
-            except (OSError, PermissionError) as e:
-                print(f"Warning: Could not read {project_path}: {e}")
+        try:
+            return _read_cached(project_path)
+        except FileNotFoundError:
+            pass  # No project-specific prompt
+        except (OSError, PermissionError) as e:
+            print(f"Warning: Could not read {project_path}: {e}")
 
     # 2. Try base template
     template_path = TEMPLATES_DIR / f"{name}.template.md"
-    if template_path.exists():
-        try:
-            return template_path.read_text(encoding="utf-8")
-        except (OSError, PermissionError) as e:
-            print(f"Warning: Could not read {template_path}: {e}")
+    try:
+        return _read_cached(template_path)
+    except FileNotFoundError:
+        pass  # No base template
+    except (OSError, PermissionError) as e:
+        print(f"Warning: Could not read {template_path}: {e}")
 
     raise FileNotFoundError(
         f"Prompt '{name}' not found in:\n"
@@ -110,19 +156,21 @@ def get_app_spec(project_dir: Path) -> str:
     # Try project prompts directory first
     project_prompts = get_project_prompts_dir(project_dir)
     spec_path = project_prompts / "app_spec.txt"
-    if spec_path.exists():
-        try:
-            return spec_path.read_text(encoding="utf-8")
-        except (OSError, PermissionError) as e:
-            raise FileNotFoundError(f"Could not read {spec_path}: {e}") from e
+    try:
+        return _read_cached(spec_path)
+    except FileNotFoundError:
+        pass  # Try legacy location
+    except (OSError, PermissionError) as e:
+        raise FileNotFoundError(f"Could not read {spec_path}: {e}") from e
 
     # Fallback to legacy location in project root
     legacy_spec = project_dir / "app_spec.txt"
-    if legacy_spec.exists():
-        try:
-            return legacy_spec.read_text(encoding="utf-8")
-        except (OSError, PermissionError) as e:
-            raise FileNotFoundError(f"Could not read {legacy_spec}: {e}") from e
+    try:
+        return _read_cached(legacy_spec)
+    except FileNotFoundError:
+        pass
+    except (OSError, PermissionError) as e:
+        raise FileNotFoundError(f"Could not read {legacy_spec}: {e}") from e
 
     raise FileNotFoundError(f"No app_spec.txt found for project: {project_dir}")
 
@@ -151,13 +199,14 @@ def scaffold_project_prompts(project_dir: Path) -> Path:
         ("overseer_prompt.template.md", "overseer_prompt.md"),
     ]
 
+    available = _available_templates()
     copied_files = []
     for template_name, dest_name in templates:
         template_path = TEMPLATES_DIR / template_name
         dest_path = project_prompts / dest_name
 
         # Only copy if template exists and destination doesn't
-        if template_path.exists() and not dest_path.exists():
+        if template_name in available and not dest_path.exists():
             try:
                 shutil.copy(template_path, dest_path)
                 copied_files.append(dest_name)
@@ -170,7 +219,7 @@ def scaffold_project_prompts(project_dir: Path) -> Path:
     # Copy CLAUDE.md template to project root (for beads workflow instructions)
     claude_template = TEMPLATES_DIR / "project_claude.md.template"
     claude_dest = project_dir / "CLAUDE.md"
-    if claude_template.exists() and not claude_dest.exists():
+    if "project_claude.md.template" in available and not claude_dest.exists():
         try:
             # Read template and substitute project name
             content = claude_template.read_text(encoding="utf-8")
@@ -186,19 +235,24 @@ def scaffold_project_prompts(project_dir: Path) -> Path:
     return project_prompts
 
 
+# .gitignore lines that already ignore the .claude directory
+_CLAUDE_IGNORE_LINES = frozenset((b".claude/", b".claude"))
+
+
 def ensure_gitignore_claude(project_dir: Path) -> None:
     """Ensure .claude/ is in project's .gitignore (credentials are sensitive)."""
     gitignore_path = project_dir / ".gitignore"
     claude_pattern = ".claude/"
 
+    # One read, no write when already ignored - leaves the file's mtime untouched
     existing_lines = []
-    if gitignore_path.exists():
-        try:
-            existing_lines = gitignore_path.read_text(encoding="utf-8").splitlines()
-            if claude_pattern in existing_lines or ".claude" in existing_lines:
-                return  # Already ignored
-        except (OSError, PermissionError):
-            pass
+    try:
+        with open(gitignore_path, "rb") as f:
+            existing_lines = f.read().splitlines()
+        if not _CLAUDE_IGNORE_LINES.isdisjoint(existing_lines):
+            return  # Already ignored
+    except (OSError, PermissionError):
+        pass  # Missing or unreadable - append below
 
     try:
         with open(gitignore_path, "a", encoding="utf-8") as f:
@@ -209,6 +263,31 @@ def ensure_gitignore_claude(project_dir: Path) -> None:
         print(f"  Warning: Could not update .gitignore: {e}")
 
 
+# Marker that distinguishes a real app spec from a placeholder
+SPEC_TAG = b"<project_specification>"
+
+
+def _has_spec_tag(spec_path: Path, chunk_size: int = 8192) -> bool:
+    """
+    Check whether a spec file contains the <project_specification> tag.
+
+    The tag sits near the top of a real spec, so the file is read in chunks
+    and the scan stops at the first match instead of loading the whole file.
+
+    Raises:
+        OSError: If the file can't be read
+    """
+    overlap = len(SPEC_TAG) - 1  # Catch a tag split across two chunks
+    tail = b""
+    with open(spec_path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            window = tail + chunk
+            if SPEC_TAG in window:
+                return True
+            tail = window[-overlap:]
+    return False
+
+
 def has_project_prompts(project_dir: Path) -> bool:
     """
     Check if a project has valid prompts set up.
@@ -227,21 +306,16 @@ def has_project_prompts(project_dir: Path) -> bool:
     project_prompts = get_project_prompts_dir(project_dir)
     app_spec = project_prompts / "app_spec.txt"
 
-    if not app_spec.exists():
-        # Also check legacy location in project root
-        legacy_spec = project_dir / "app_spec.txt"
-        if legacy_spec.exists():
-            try:
-                content = legacy_spec.read_text(encoding="utf-8")
-                return "<project_specification>" in content
-            except (OSError, PermissionError):
-                return False
+    # Open directly - a missing file surfaces as FileNotFoundError, no separate exists() probe
+    try:
+        return _has_spec_tag(app_spec)
+    except FileNotFoundError:
+        pass  # Also check legacy location in project root
+    except (OSError, PermissionError):
         return False
 
-    # Check for valid spec content
     try:
-        content = app_spec.read_text(encoding="utf-8")
-        return "<project_specification>" in content
+        return _has_spec_tag(project_dir / "app_spec.txt")
     except (OSError, PermissionError):
         return False
 
@@ -261,20 +335,22 @@ def copy_spec_to_project(project_dir: Path) -> None:
     spec_dest = project_dir / "app_spec.txt"
 
     # Don't overwrite if already exists
-    if spec_dest.exists():
+    if os.path.exists(spec_dest):
         return
 
     # Copy from project prompts directory
     project_prompts = get_project_prompts_dir(project_dir)
     project_spec = project_prompts / "app_spec.txt"
-    if project_spec.exists():
-        try:
-            shutil.copy(project_spec, spec_dest)
-            print("Copied app_spec.txt to project directory")
-            return
-        except (OSError, PermissionError) as e:
-            print(f"Warning: Could not copy app_spec.txt: {e}")
-            return
+    try:
+        # copyfile moves the bytes in-kernel (sendfile) and skips copy()'s chmod
+        shutil.copyfile(project_spec, spec_dest)
+        print("Copied app_spec.txt to project directory")
+        return
+    except FileNotFoundError:
+        pass  # No spec in the prompts directory yet
+    except (OSError, PermissionError) as e:
+        print(f"Warning: Could not copy app_spec.txt: {e}")
+        return
 
     print("Warning: No app_spec.txt found to copy to project directory")
 
@@ -296,14 +372,10 @@ def is_existing_repo_project(project_dir: Path) -> bool:
         True if this is an existing repo (no app_spec), False if new project with spec
     """
     app_spec = project_dir / "prompts" / "app_spec.txt"
-    if not app_spec.exists():
-        return True
-
     try:
-        content = app_spec.read_text(encoding="utf-8")
-        return "<project_specification>" not in content
+        return not _has_spec_tag(app_spec)
     except (OSError, PermissionError):
-        return True
+        return True  # Missing or unreadable spec
 
 
 def refresh_project_prompts(project_dir: Path) -> list[str]:
@@ -345,12 +417,13 @@ def refresh_project_prompts(project_dir: Path) -> list[str]:
             ("hound_prompt.template.md", "hound_prompt.md"),
         ]
 
+    available = _available_templates()
     updated_files = []
     for template_name, dest_name in templates:
         template_path = TEMPLATES_DIR / template_name
         dest_path = project_prompts / dest_name
 
-        if not template_path.exists():
+        if template_name not in available:
             print(f"  Warning: Template not found: {template_name}")
             continue
 
@@ -447,12 +520,13 @@ def scaffold_existing_repo(project_dir: Path) -> None:
         ("overseer_prompt_existing.template.md", "overseer_prompt.md"),
     ]
 
+    available = _available_templates()
     for template_name, dest_name in templates:
         template_path = TEMPLATES_DIR / template_name
         dest_path = prompts_dir / dest_name
 
         # Only copy if template exists and destination doesn't
-        if template_path.exists() and not dest_path.exists():
+        if template_name in available and not dest_path.exists():
             try:
                 shutil.copy(template_path, dest_path)
                 print(f"  Created {dest_name}")
@@ -9,18 +9,22 @@ Uses SQLite database stored at ~/.zerocoder/registry.db.
 import logging
 import os
 import re
+import threading
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Text, create_engine
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Text, create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 # Module logger
 logger = logging.getLogger(__name__)
 
+# Valid project names: letters, numbers, hyphens and underscores (1-50 chars)
+PROJECT_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_-]{1,50}$')
+
 
 # =============================================================================
 # Exceptions
@@ -109,6 +113,11 @@ class FeatureStatsCache(Base):
 _engine = None
 _SessionLocal = None
 
+# In-memory cache of project info keyed by name. Only this module writes the
+# projects table, so every write path below drops the affected entries.
+_project_cache: dict[str, dict[str, Any]] = {}
+_project_cache_lock = threading.RLock()
+
 
 def get_config_dir() -> Path:
     """
@@ -134,6 +143,26 @@ def get_registry_path() -> Path:
     return get_config_dir() / "registry.db"
 
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Configure each new SQLite connection for concurrent access.
+
+    WAL lets readers (API requests, pollers) proceed while a writer holds the
+    lock, synchronous=NORMAL drops the per-commit fsync that WAL makes
+    unnecessary, and busy_timeout makes SQLite wait for the lock instead of
+    failing immediately with "database is locked". temp_store=MEMORY keeps
+    temp tables and indices off disk.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+    finally:
+        cursor.close()
+
+
 def _get_engine():
     """
     Get or create the database engine (singleton pattern).
@@ -147,6 +176,7 @@ def _get_engine():
         db_path = get_registry_path()
         db_url = f"sqlite:///{db_path.as_posix()}"
         _engine = create_engine(db_url, connect_args={"check_same_thread": False})
+        event.listen(_engine, "connect", _set_sqlite_pragmas)
         Base.metadata.create_all(bind=_engine)
         _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=_engine)
         logger.debug("Initialized registry database at: %s", db_path)
@@ -154,6 +184,13 @@ def _get_engine():
     return _engine, _SessionLocal
 
 
+def _forget_projects(*names: str) -> None:
+    """Drop cached info for the given projects (call after the write commits)."""
+    with _project_cache_lock:
+        for name in names:
+            _project_cache.pop(name, None)
+
+
 @contextmanager
 def _get_session():
     """
@@ -191,7 +228,7 @@ def register_project(name: str, path: Path) -> None:
         RegistryError: If a project with that name already exists.
     """
     # Validate name
-    if not re.match(r'^[a-zA-Z0-9_-]{1,50}$', name):
+    if not PROJECT_NAME_PATTERN.match(name):
         raise ValueError(
             "Invalid project name. Use only letters, numbers, hyphens, "
             "and underscores (1-50 chars)."
@@ -213,6 +250,7 @@ def register_project(name: str, path: Path) -> None:
         )
         session.add(project)
 
+    _forget_projects(name)
     logger.info("Registered project '%s' at path: %s", name, path)
 
 
@@ -234,6 +272,7 @@ def unregister_project(name: str) -> bool:
 
         session.delete(project)
 
+    _forget_projects(name)
     logger.info("Unregistered project: %s", name)
     return True
 
@@ -248,15 +287,10 @@ def get_project_path(name: str) -> Path | None:
     Returns:
         The project Path, or None if not found.
     """
-    _, SessionLocal = _get_engine()
-    session = SessionLocal()
-    try:
-        project = session.query(Project).filter(Project.name == name).first()
-        if project is None:
-            return None
-        return Path(project.path)
-    finally:
-        session.close()
+    info = get_project_info(name)
+    if info is None:
+        return None
+    return Path(info["path"])
 
 
 def list_registered_projects() -> dict[str, dict[str, Any]]:
@@ -291,18 +325,25 @@ def get_project_info(name: str) -> dict[str, Any] | None:
     Returns:
         Project info dictionary, or None if not found.
     """
-    _, SessionLocal = _get_engine()
-    session = SessionLocal()
-    try:
-        project = session.query(Project).filter(Project.name == name).first()
-        if project is None:
-            return None
-        return {
-            "path": project.path,
-            "created_at": project.created_at.isoformat() if project.created_at else None
-        }
-    finally:
-        session.close()
+    with _project_cache_lock:
+        info = _project_cache.get(name)
+        if info is None:
+            _, SessionLocal = _get_engine()
+            session = SessionLocal()
+            try:
+                project = session.query(Project).filter(Project.name == name).first()
+                if project is None:
+                    return None
+                info = {
+                    "path": project.path,
+                    "created_at": project.created_at.isoformat() if project.created_at else None
+                }
+            finally:
+                session.close()
+            _project_cache[name] = info
+
+    # Copy so callers can't mutate the cached entry
+    return dict(info)
 
 
 def update_project_path(name: str, new_path: Path) -> bool:
@@ -325,6 +366,7 @@ def update_project_path(name: str, new_path: Path) -> bool:
 
         project.path = new_path.as_posix()
 
+    _forget_projects(name)
     return True
 
 
@@ -380,6 +422,8 @@ def cleanup_stale_projects() -> list[str]:
                 session.delete(project)
                 removed.append(project.name)
 
+    _forget_projects(*removed)
+
     if removed:
         logger.info("Cleaned up stale projects: %s", removed)
 
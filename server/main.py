@@ -23,7 +23,7 @@ logger = logging.getLogger(__name__)
 ALLOW_EXTERNAL_ACCESS = os.getenv("ALLOW_EXTERNAL_ACCESS", "false").lower() == "true"
 CORS_ORIGINS_ENV = os.getenv("CORS_ORIGINS", "")
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from .routers import (
@@ -171,22 +171,79 @@ app.add_middleware(
 # Security Middleware
 # ============================================================================
 
+# Client hosts allowed when ALLOW_EXTERNAL_ACCESS is off (None = no client info)
+LOCALHOST_HOSTS = frozenset({"127.0.0.1", "::1", "localhost", None})
+
+
+def _is_allowed_client(client_host: str | None) -> bool:
+    """Check a client host against the localhost-only access policy."""
+    return ALLOW_EXTERNAL_ACCESS or client_host in LOCALHOST_HOSTS
+
+
 @app.middleware("http")
 async def require_localhost(request: Request, call_next):
     """Only allow requests from localhost (unless ALLOW_EXTERNAL_ACCESS is set)."""
-    # Skip localhost check if external access is enabled (for Docker)
-    if ALLOW_EXTERNAL_ACCESS:
-        return await call_next(request)
-
     client_host = request.client.host if request.client else None
 
-    # Allow localhost connections
-    if client_host not in ("127.0.0.1", "::1", "localhost", None):
+    # Allow localhost connections (any host if external access is enabled, for Docker)
+    if not _is_allowed_client(client_host):
         raise HTTPException(status_code=403, detail="Localhost access only")
 
     return await call_next(request)
 
 
+# ============================================================================
+# Health Check Fast Path
+# ============================================================================
+
+HEALTH_CHECK_PATHS = frozenset({"/api/health"})
+HEALTH_CHECK_BODY = b'{"status":"healthy"}'  # Also served by the /api/health route
+
+
+class HealthCheckInterceptor:
+    """
+    Pure ASGI middleware that answers health probes ahead of the middleware stack.
+
+    Health checks are polled frequently and always return the same static
+    payload, so there is no need to run them through the HTTP middlewares and
+    router. The /api/health route stays registered (and serves the same body)
+    so it is still listed in the OpenAPI docs.
+
+    Only same-origin probes from clients that pass the localhost policy are
+    answered here. Requests with an Origin header fall through so
+    CORSMiddleware can add its headers, and disallowed clients fall through
+    to require_localhost, which rejects them.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] == "http"
+            and scope["method"] == "GET"
+            and scope["path"] in HEALTH_CHECK_PATHS
+            and _is_allowed_client(scope["client"][0] if scope.get("client") else None)
+            and not any(name == b"origin" for name, _ in scope["headers"])
+        ):
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(HEALTH_CHECK_BODY)).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": HEALTH_CHECK_BODY})
+            return
+
+        await self.app(scope, receive, send)
+
+
+# Added last so it is the outermost middleware
+app.add_middleware(HealthCheckInterceptor)
+
+
 # ============================================================================
 # Include Routers
 # ============================================================================
@@ -216,7 +273,7 @@ async def websocket_endpoint(websocket: WebSocket, project_name: str):
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy"}
+    return Response(content=HEALTH_CHECK_BODY, media_type="application/json")
 
 
 @app.get("/api/setup/status", response_model=SetupStatus)
@@ -8,6 +8,7 @@ WebSocket and REST endpoints for the read-only project assistant.
 import json
 import logging
 import re
+import sys
 from pathlib import Path
 from typing import Optional
 
@@ -35,14 +36,13 @@ router = APIRouter(prefix="/api/assistant", tags=["assistant-chat"])
 # Root directory
 ROOT_DIR = Path(__file__).parent.parent.parent
 
+# Add root to path for imports
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
 
 def _get_project_path(project_name: str) -> Optional[Path]:
     """Get project path from registry."""
-    import sys
-    root = Path(__file__).parent.parent.parent
-    if str(root) not in sys.path:
-        sys.path.insert(0, str(root))
-
     from registry import get_project_path
     return get_project_path(project_name)
 
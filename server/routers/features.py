@@ -28,14 +28,14 @@ from ..services.feature_poller import (
 
 logger = logging.getLogger(__name__)
 
+# Add root to path for imports
+_root = Path(__file__).parent.parent.parent
+if str(_root) not in sys.path:
+    sys.path.insert(0, str(_root))
+
 
 def _get_project_path(project_name: str) -> Path:
     """Get project path from registry."""
-    # Add parent to path for imports
-    _root = Path(__file__).parent.parent.parent
-    if str(_root) not in sys.path:
-        sys.path.insert(0, str(_root))
-
     from registry import get_project_path
     return get_project_path(project_name)
 
@@ -98,6 +98,9 @@ HIDDEN_PATTERNS = [
     r".*secrets.*",      # Secrets files
 ]
 
+# All hidden patterns combined into one alternation so each name is matched in a single pass
+HIDDEN_PATTERNS_RE = re.compile("|".join(f"(?:{p})" for p in HIDDEN_PATTERNS), re.IGNORECASE)
+
 
 def get_blocked_paths() -> set[Path]:
     """Get the set of blocked paths for the current platform."""
@@ -169,10 +172,7 @@ def is_hidden_file(path: Path) -> bool:
 
 def matches_blocked_pattern(name: str) -> bool:
     """Check if filename matches a blocked pattern."""
-    for pattern in HIDDEN_PATTERNS:
-        if re.match(pattern, name, re.IGNORECASE):
-            return True
-    return False
+    return HIDDEN_PATTERNS_RE.match(name) is not None
 
 
 def is_unc_path(path_str: str) -> bool:
@@ -8,6 +8,7 @@ Uses project registry for path lookups instead of fixed generations/ directory.
 
 import re
 import shutil
+import sys
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException
@@ -28,6 +29,11 @@ from ..schemas import (
 DEFAULT_AGENT_MODEL = "glm-4-7"
 AGENT_CONFIG_FILENAME = ".agent_config.json"
 
+# Add root to path for imports
+_root = Path(__file__).parent.parent.parent
+if str(_root) not in sys.path:
+    sys.path.insert(0, str(_root))
+
 # Lazy imports to avoid circular dependencies
 _imports_initialized = False
 _has_project_prompts = None
@@ -45,11 +51,6 @@ def _init_imports():
     if _imports_initialized:
         return
 
-    import sys
-    root = Path(__file__).parent.parent.parent
-    if str(root) not in sys.path:
-        sys.path.insert(0, str(root))
-
     from progress import count_passing_tests
     from prompts import get_project_prompts_dir, has_project_prompts, scaffold_project_prompts
 
@@ -62,11 +63,6 @@ def _init_imports():
 
 def _get_registry_functions():
     """Get registry functions with lazy import."""
-    import sys
-    root = Path(__file__).parent.parent.parent
-    if str(root) not in sys.path:
-        sys.path.insert(0, str(root))
-
     from registry import (
         get_project_path,
         list_registered_projects,
@@ -159,8 +155,8 @@ async def list_projects():
     _init_imports()
     _, _, _, list_registered_projects, validate_project_path = _get_registry_functions()
 
-    # Import get_project_container for agent status
-    from .agent import get_project_container
+    # Import get_container_manager for agent status
+    from ..services.container_manager import get_container_manager
 
     projects = list_registered_projects()
     result = []
@@ -181,7 +177,8 @@ async def list_projects():
         agent_status = None
         agent_running = None
         try:
-            manager = get_project_container(name)
+            # Path is already known from the registry listing - no per-project lookup
+            manager = get_container_manager(name, project_dir)
             status_dict = manager.get_status_dict()
             agent_status = status_dict["status"]
             agent_running = status_dict.get("agent_running", False)
@@ -641,10 +638,6 @@ async def add_existing_repo(request: AddExistingRepoRequest):
     register_project, _, get_project_path, _, _ = _get_registry_functions()
 
     # Import scaffold function for existing repos
-    import sys
-    root = Path(__file__).parent.parent.parent
-    if str(root) not in sys.path:
-        sys.path.insert(0, str(root))
     from prompts import scaffold_existing_repo
 
     name = validate_project_name(request.name)
@@ -8,6 +8,7 @@ WebSocket and REST endpoints for interactive spec creation with Claude.
 import json
 import logging
 import re
+import sys
 from pathlib import Path
 from typing import Optional
 
@@ -30,14 +31,13 @@ router = APIRouter(prefix="/api/spec", tags=["spec-creation"])
 # Root directory
 ROOT_DIR = Path(__file__).parent.parent.parent
 
+# Add root to path for imports
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
 
 def _get_project_path(project_name: str) -> Path:
     """Get project path from registry."""
-    import sys
-    root = Path(__file__).parent.parent.parent
-    if str(root) not in sys.path:
-        sys.path.insert(0, str(root))
-
     from registry import get_project_path
     return get_project_path(project_name)
 
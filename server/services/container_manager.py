@@ -16,7 +16,7 @@ import tempfile
 import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Awaitable, Callable, Literal, Set
+from typing import Awaitable, Callable, Literal
 import sys
 
 # Add root to path for imports
@@ -24,6 +24,7 @@ _root = Path(__file__).parent.parent.parent
 if str(_root) not in sys.path:
     sys.path.insert(0, str(_root))
 
+from progress import _json_loads
 from prompts import refresh_project_prompts
 
 logger = logging.getLogger(__name__)
@@ -102,12 +103,16 @@ SENSITIVE_PATTERNS = [
     r'secret[=:][^\s]+',
 ]
 
+# All sensitive patterns combined into one alternation so each line is scanned once
+SENSITIVE_PATTERN_RE = re.compile("|".join(f"(?:{p})" for p in SENSITIVE_PATTERNS), re.IGNORECASE)
+
 
 def sanitize_output(line: str) -> str:
     """Remove sensitive information from output lines."""
-    for pattern in SENSITIVE_PATTERNS:
-        line = re.sub(pattern, '[REDACTED]', line, flags=re.IGNORECASE)
-    return line
+    # Every pattern needs a "-" (sk-...) or a "=" / ":" separator - most log lines can skip the regex
+    if "-" not in line and "=" not in line and ":" not in line:
+        return line
+    return SENSITIVE_PATTERN_RE.sub('[REDACTED]', line)
 
 
 class ContainerManager:
@@ -160,9 +165,10 @@ class ContainerManager:
         # Model to use when forcing Claude SDK (defaults to Opus 4.5)
         self._forced_model: str = "claude-opus-4-5-20251101"
 
-        # Callbacks for WebSocket notifications
-        self._output_callbacks: Set[Callable[[str], Awaitable[None]]] = set()
-        self._status_callbacks: Set[Callable[[str], Awaitable[None]]] = set()
+        # Callbacks for WebSocket notifications. Stored as tuples in registration
+        # order and replaced on add/remove, so dispatch can read them without locking.
+        self._output_callbacks: tuple[Callable[[str], Awaitable[None]], ...] = ()
+        self._status_callbacks: tuple[Callable[[str], Awaitable[None]], ...] = ()
         self._callbacks_lock = threading.Lock()
 
         # Check initial container status
@@ -288,10 +294,7 @@ class ContainerManager:
 
     def _notify_status_change(self, status: str) -> None:
         """Notify all registered callbacks of status change."""
-        with self._callbacks_lock:
-            callbacks = list(self._status_callbacks)
-
-        for callback in callbacks:
+        for callback in self._status_callbacks:
             try:
                 loop = asyncio.get_running_loop()
                 loop.create_task(self._safe_callback(callback, status))
@@ -308,22 +311,24 @@ class ContainerManager:
     def add_output_callback(self, callback: Callable[[str], Awaitable[None]]) -> None:
         """Add a callback for output lines."""
         with self._callbacks_lock:
-            self._output_callbacks.add(callback)
+            if callback not in self._output_callbacks:
+                self._output_callbacks += (callback,)
 
     def remove_output_callback(self, callback: Callable[[str], Awaitable[None]]) -> None:
         """Remove an output callback."""
         with self._callbacks_lock:
-            self._output_callbacks.discard(callback)
+            self._output_callbacks = tuple(cb for cb in self._output_callbacks if cb != callback)
 
     def add_status_callback(self, callback: Callable[[str], Awaitable[None]]) -> None:
         """Add a callback for status changes."""
         with self._callbacks_lock:
-            self._status_callbacks.add(callback)
+            if callback not in self._status_callbacks:
+                self._status_callbacks += (callback,)
 
     def remove_status_callback(self, callback: Callable[[str], Awaitable[None]]) -> None:
         """Remove a status callback."""
         with self._callbacks_lock:
-            self._status_callbacks.discard(callback)
+            self._status_callbacks = tuple(cb for cb in self._status_callbacks if cb != callback)
 
     def _update_activity(self) -> None:
         """Update last activity timestamp."""
@@ -393,26 +398,24 @@ class ContainerManager:
         if not issues_file.exists():
             return False
         try:
-            open_count = 0
-            with open(issues_file, "r") as f:
-                for line in f:
-                    try:
-                        issue = json.loads(line.strip())
-                        if issue.get("status") in ("open", "in_progress"):
-                            open_count += 1
-                    except json.JSONDecodeError:
-                        continue
-            return open_count > 0
+            # One read for the whole file, and stop at the first open issue
+            for line in issues_file.read_bytes().splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    issue = _json_loads(line)
+                except ValueError:  # Malformed line
+                    continue
+                if issue.get("status") in ("open", "in_progress"):
+                    return True
+            return False
         except Exception as e:
             logger.warning(f"Failed to read issues file directly: {e}")
             return False
 
     async def _broadcast_output(self, line: str) -> None:
         """Broadcast output line to all registered callbacks."""
-        with self._callbacks_lock:
-            callbacks = list(self._output_callbacks)
-
-        for callback in callbacks:
+        for callback in self._output_callbacks:
             await self._safe_callback(callback, line)
 
     async def _stream_logs(self) -> None:
@@ -1042,11 +1045,6 @@ class ContainerManager:
             overseer_prompt_path = self.project_dir / "prompts" / "overseer_prompt.md"
             if not overseer_prompt_path.exists():
                 # Fall back to template if project-specific doesn't exist
-                import sys
-                from pathlib import Path
-                root = Path(__file__).parent.parent.parent
-                if str(root) not in sys.path:
-                    sys.path.insert(0, str(root))
                 from prompts import get_overseer_prompt
                 try:
                     instruction = get_overseer_prompt(self.project_dir)
@@ -1426,6 +1424,75 @@ def check_image_exists() -> bool:
         return False
 
 
+async def _check_agent_health(manager: ContainerManager) -> bool:
+    """
+    Check a single container's agent and restart it if needed.
+
+    The docker probes are blocking subprocess calls, so they run in a worker
+    thread to let checks for different containers overlap.
+
+    Returns:
+        True if the container or agent was restarted
+    """
+    # Only monitor user-started containers
+    if not manager.user_started:
+        return False
+
+    # Skip if restart already in progress
+    if manager._restarting:
+        return False
+
+    # Sync status with Docker to get latest state
+    await asyncio.to_thread(manager._sync_status)
+
+    # Skip completed containers (all features done)
+    if manager.status == "completed":
+        return False
+
+    # Skip not_created containers
+    if manager.status == "not_created":
+        return False
+
+    # Handle stopped container - restart it entirely
+    if manager.status == "stopped":
+        # Check if there are still features to work on
+        if not manager.has_open_features():
+            logger.info(f"Container {manager.container_name} stopped, no open features - marking complete")
+            manager.status = "completed"
+            manager._remove_user_started_marker()
+            return False
+
+        logger.warning(
+            f"Container {manager.container_name} stopped unexpectedly (user_started=True), restarting..."
+        )
+        try:
+            # Restart container and agent
+            success, message = await manager.start()
+            if success:
+                logger.info(f"Successfully restarted container {manager.container_name}")
+                return True
+            logger.error(f"Failed to restart container {manager.container_name}: {message}")
+        except Exception as e:
+            logger.exception(f"Error restarting container {manager.container_name}: {e}")
+        return False
+
+    # Handle running container with dead agent process
+    if manager.status == "running" and not await asyncio.to_thread(manager.is_agent_running):
+        logger.warning(
+            f"Agent not running in {manager.container_name}, restarting agent..."
+        )
+        try:
+            success, message = await manager.restart_agent()
+            if success:
+                logger.info(f"Successfully restarted agent in {manager.container_name}")
+                return True
+            logger.error(f"Failed to restart agent in {manager.container_name}: {message}")
+        except Exception as e:
+            logger.exception(f"Error restarting agent in {manager.container_name}: {e}")
+
+    return False
+
+
 async def monitor_agent_health() -> list[str]:
     """
     Check health of agents in user-started containers and restart if needed.
@@ -1435,74 +1502,22 @@ async def monitor_agent_health() -> list[str]:
     1. Container is running but agent process died → restart agent
     2. Container itself stopped unexpectedly → restart container + agent
 
+    Containers are checked concurrently, so a full pass takes as long as the
+    slowest container rather than the sum of all of them.
+
     Returns:
         List of container names that were restarted
     """
-    restarted = []
-
     with _managers_lock:
         managers = list(_managers.values())
 
-    for manager in managers:
-        # Only monitor user-started containers
-        if not manager.user_started:
-            continue
-
-        # Skip if restart already in progress
-        if manager._restarting:
-            continue
-
-        # Sync status with Docker to get latest state
-        manager._sync_status()
-
-        # Skip completed containers (all features done)
-        if manager.status == "completed":
-            continue
-
-        # Skip not_created containers
-        if manager.status == "not_created":
-            continue
-
-        # Handle stopped container - restart it entirely
-        if manager.status == "stopped":
-            # Check if there are still features to work on
-            if not manager.has_open_features():
-                logger.info(f"Container {manager.container_name} stopped, no open features - marking complete")
-                manager.status = "completed"
-                manager._remove_user_started_marker()
-                continue
-
-            logger.warning(
-                f"Container {manager.container_name} stopped unexpectedly (user_started=True), restarting..."
-            )
-            try:
-                # Restart container and agent
-                success, message = await manager.start()
-                if success:
-                    restarted.append(manager.container_name)
-                    logger.info(f"Successfully restarted container {manager.container_name}")
-                else:
-                    logger.error(f"Failed to restart container {manager.container_name}: {message}")
-            except Exception as e:
-                logger.exception(f"Error restarting container {manager.container_name}: {e}")
-            continue
-
-        # Handle running container with dead agent process
-        if manager.status == "running" and not manager.is_agent_running():
-            logger.warning(
-                f"Agent not running in {manager.container_name}, restarting agent..."
-            )
-            try:
-                success, message = await manager.restart_agent()
-                if success:
-                    restarted.append(manager.container_name)
-                    logger.info(f"Successfully restarted agent in {manager.container_name}")
-                else:
-                    logger.error(f"Failed to restart agent in {manager.container_name}: {message}")
-            except Exception as e:
-                logger.exception(f"Error restarting agent in {manager.container_name}: {e}")
+    results = await asyncio.gather(*map(_check_agent_health, managers))
 
-    return restarted
+    return [
+        manager.container_name
+        for manager, was_restarted in zip(managers, results)
+        if was_restarted
+    ]
 
 
 async def start_agent_health_monitor() -> None:
@@ -20,6 +20,12 @@ POLL_INTERVAL = 30
 # In-memory cache for quick access to stats
 _stats_cache: Dict[str, dict] = {}
 
+# Stats for a project that hasn't been polled yet (copied before returning)
+_EMPTY_STATS = {"pending": 0, "in_progress": 0, "done": 0, "total": 0, "percentage": 0.0}
+
+# In-memory cache of feature lists, filled on read and dropped on every write
+_features_cache: Dict[str, list[dict]] = {}
+
 
 async def poll_container_features(container_name: str, project_name: str) -> dict | None:
     """
@@ -77,6 +83,8 @@ def update_feature_cache(project_name: str, data: dict) -> None:
         project_name: Project name
         data: Feature status data from container
     """
+    from sqlalchemy import insert
+
     from registry import _get_session, FeatureCache, FeatureStatsCache
 
     now = datetime.now()
@@ -109,26 +117,30 @@ def update_feature_cache(project_name: str, data: dict) -> None:
             FeatureCache.project_name == project_name
         ).delete()
 
-        # Insert new features
-        for f in features:
-            feature_record = FeatureCache(
-                project_name=project_name,
-                feature_id=f.get("id", ""),
-                priority=f.get("priority", 999),
-                category=f.get("category", ""),
-                name=f.get("name", ""),
-                description=f.get("description", ""),
-                steps_json=json.dumps(f.get("steps", [])),
-                status=f.get("status", "open"),
-                updated_at=now,
-            )
-            session.add(feature_record)
+        # Insert new features with a single executemany instead of one ORM object each
+        rows = [
+            {
+                "project_name": project_name,
+                "feature_id": f.get("id", ""),
+                "priority": f.get("priority", 999),
+                "category": f.get("category", ""),
+                "name": f.get("name", ""),
+                "description": f.get("description", ""),
+                "steps_json": json.dumps(f.get("steps", [])),
+                "status": f.get("status", "open"),
+                "updated_at": now,
+            }
+            for f in features
+        ]
+        if rows:
+            session.execute(insert(FeatureCache), rows)
 
     # Update in-memory cache
     _stats_cache[project_name] = {
         "stats": stats,
         "last_polled_at": now.isoformat(),
     }
+    _features_cache.pop(project_name, None)
 
     logger.debug(f"Updated cache for {project_name}: {stats}")
 
@@ -169,13 +181,19 @@ def get_cached_stats(project_name: str) -> dict:
     finally:
         session.close()
 
-    return {"pending": 0, "in_progress": 0, "done": 0, "total": 0, "percentage": 0.0}
+    return _EMPTY_STATS.copy()
 
 
 def get_cached_features(project_name: str) -> list[dict]:
     """
-    Get cached features for a project from SQLite.
+    Get cached features for a project (in-memory first, then SQLite).
+
+    The returned feature dicts are shared with the cache - treat them as read-only.
     """
+    # Try in-memory cache first
+    if project_name in _features_cache:
+        return list(_features_cache[project_name])
+
     from registry import _get_engine, FeatureCache
 
     _, SessionLocal = _get_engine()
@@ -197,7 +215,9 @@ def get_cached_features(project_name: str) -> list[dict]:
                 "passes": r.status == "closed",
                 "in_progress": r.status == "in_progress",
             })
-        return features
+        # Populate in-memory cache
+        _features_cache[project_name] = features
+        return list(features)
     finally:
         session.close()
 
@@ -207,6 +227,7 @@ def clear_cache(project_name: str) -> None:
     # Clear in-memory cache
     if project_name in _stats_cache:
         del _stats_cache[project_name]
+    _features_cache.pop(project_name, None)
 
     # Clear SQLite cache
     from registry import _get_session, FeatureCache, FeatureStatsCache
@@ -231,16 +252,22 @@ async def poll_all_running_containers() -> list[str]:
 
     polled = []
 
+    # Only poll running containers
     with _managers_lock:
-        managers = list(_managers.items())
+        running = [
+            (manager.container_name, project_name)
+            for project_name, manager in _managers.items()
+            if manager.status == "running"
+        ]
 
-    for project_name, manager in managers:
-        # Only poll running containers
-        if manager.status != "running":
-            continue
+    if not running:
+        return polled
 
-        data = await poll_container_features(manager.container_name, project_name)
+    # Each poll is an independent docker exec round-trip, so run them concurrently
+    container_names, project_names = zip(*running)
+    results = await asyncio.gather(*map(poll_container_features, container_names, project_names))
 
+    for project_name, data in zip(project_names, results):
         if data:
             update_feature_cache(project_name, data)
             polled.append(project_name)
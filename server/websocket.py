@@ -9,6 +9,8 @@ import asyncio
 import json
 import logging
 import re
+import sys
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 from typing import Set
@@ -17,19 +19,22 @@ from fastapi import WebSocket, WebSocketDisconnect
 
 from .services.container_manager import get_container_manager
 
+# Add root to path for imports
+_root = Path(__file__).parent.parent
+if str(_root) not in sys.path:
+    sys.path.insert(0, str(_root))
+
 # Lazy imports
 _count_passing_tests = None
 
 logger = logging.getLogger(__name__)
 
+# Max concurrent sends per broadcast step; larger fan-outs yield to the event loop between batches
+BROADCAST_BATCH_SIZE = 50
+
 
 def _get_project_path(project_name: str) -> Path:
     """Get project path from registry."""
-    import sys
-    root = Path(__file__).parent.parent
-    if str(root) not in sys.path:
-        sys.path.insert(0, str(root))
-
     from registry import get_project_path
     return get_project_path(project_name)
 
@@ -38,10 +43,6 @@ def _get_count_passing_tests():
     """Lazy import of count_passing_tests."""
     global _count_passing_tests
     if _count_passing_tests is None:
-        import sys
-        root = Path(__file__).parent.parent
-        if str(root) not in sys.path:
-            sys.path.insert(0, str(root))
         from progress import count_passing_tests
         _count_passing_tests = count_passing_tests
     return _count_passing_tests
@@ -52,7 +53,7 @@ class ConnectionManager:
 
     def __init__(self):
         # project_name -> set of WebSocket connections
-        self.active_connections: dict[str, Set[WebSocket]] = {}
+        self.active_connections: defaultdict[str, Set[WebSocket]] = defaultdict(set)
         self._lock = asyncio.Lock()
 
     async def connect(self, websocket: WebSocket, project_name: str):
@@ -60,41 +61,51 @@ class ConnectionManager:
         await websocket.accept()
 
         async with self._lock:
-            if project_name not in self.active_connections:
-                self.active_connections[project_name] = set()
             self.active_connections[project_name].add(websocket)
 
     async def disconnect(self, websocket: WebSocket, project_name: str):
         """Remove a WebSocket connection."""
         async with self._lock:
-            if project_name in self.active_connections:
-                self.active_connections[project_name].discard(websocket)
-                if not self.active_connections[project_name]:
-                    del self.active_connections[project_name]
+            connections = self.active_connections[project_name]
+            connections.discard(websocket)
+            if not connections:
+                del self.active_connections[project_name]
 
     async def broadcast_to_project(self, project_name: str, message: dict):
         """Broadcast a message to all connections for a project."""
         async with self._lock:
-            connections = list(self.active_connections.get(project_name, set()))
+            connections = list(self.active_connections.get(project_name, ()))
 
-        dead_connections = []
+        if not connections:
+            return
 
-        for connection in connections:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                dead_connections.append(connection)
+        # Serialize once (same encoding as WebSocket.send_json) and send to all clients concurrently
+        payload = json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+        dead_connections = []
+        for start in range(0, len(connections), BROADCAST_BATCH_SIZE):
+            if start:
+                await asyncio.sleep(0)  # Let other tasks run between batches
+            batch = connections[start:start + BROADCAST_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(connection.send_text(payload) for connection in batch),
+                return_exceptions=True,
+            )
+            dead_connections.extend(
+                connection for connection, result in zip(batch, results)
+                if isinstance(result, Exception)
+            )
 
         # Clean up dead connections
         if dead_connections:
             async with self._lock:
-                for connection in dead_connections:
-                    if project_name in self.active_connections:
-                        self.active_connections[project_name].discard(connection)
+                remaining = self.active_connections[project_name]
+                remaining.difference_update(dead_connections)
+                if not remaining:
+                    del self.active_connections[project_name]
 
     def get_connection_count(self, project_name: str) -> int:
         """Get number of active connections for a project."""
-        return len(self.active_connections.get(project_name, set()))
+        return len(self.active_connections.get(project_name, ()))
 
 
 # Global connection manager
@@ -118,8 +129,9 @@ async def poll_progress(websocket: WebSocket, project_name: str, project_dir: Pa
 
     while True:
         try:
-            # Pass project_name to enable cache lookup when container is running
-            passing, in_progress, total = count_passing_tests(project_dir, project_name)
+            # Pass project_name to enable cache lookup when container is running.
+            # The JSONL fallback does file I/O and parsing, so keep it off the event loop.
+            passing, in_progress, total = await asyncio.to_thread(count_passing_tests, project_dir, project_name)
 
             # Only send if changed
             if passing != last_passing or in_progress != last_in_progress or total != last_total:
@@ -208,7 +220,7 @@ async def project_websocket(websocket: WebSocket, project_name: str):
 
         # Send initial progress (pass project_name for cache lookup)
         count_passing_tests = _get_count_passing_tests()
-        passing, in_progress, total = count_passing_tests(project_dir, project_name)
+        passing, in_progress, total = await asyncio.to_thread(count_passing_tests, project_dir, project_name)
         percentage = (passing / total * 100) if total > 0 else 0
         await websocket.send_json({
             "type": "progress",